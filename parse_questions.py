@@ -6,18 +6,38 @@
 
 import re
 import json
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from typing import List, Dict, Any
 
+# orjson序列化速度约为标准库的5-10倍，未安装时退回json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 预编译正则，避免在逐段落循环中反复查询re模块缓存
+_NUM_DOT_RE = re.compile(r'^(\d+)\.(.+)')
+_ABCD_RE = re.compile(r'^[A-D]\.')
+_ANS_EMBED_RE = re.compile(r'(.+?)答案[:：]\s*([对错A-D]+)')
+_A_OPT_RE = re.compile(r'(.+?)\s*A\.(.+)$')
+
+# 题型标题与题型的映射；标题段落极少，先做廉价的前缀判断再查表
+_SECTION_MARKERS = {
+    '一、判断题': 'judgment',
+    '二、单选题': 'single_choice',
+    '三、多选题': 'multiple_choice',
+}
+_SECTION_PREFIXES = ('一、', '二、', '三、')
+
 def clean_text(text: str) -> str:
     """清理文本，移除多余的空白字符"""
-    return re.sub(r'\s+', ' ', text.strip())
+    # str.split()本身按任意空白切分并丢弃空串，比正则替换更快
+    return ' '.join(text.split())
 
 def extract_answer_from_text(text: str) -> tuple:
     """从文本中提取答案，返回(清理后的题目, 答案)"""
     # 匹配题目中包含答案的情况
-    answer_pattern = r'(.+?)答案[:：]\s*([对错A-D]+)'
-    match = re.search(answer_pattern, text)
+    match = _ANS_EMBED_RE.search(text)
     if match:
         question = match.group(1).strip()
         answer = match.group(2).strip()
@@ -37,9 +57,11 @@ def parse_questions_html(file_path: str) -> Dict[str, List[Dict[str, Any]]]:
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
     
-    # 使用BeautifulSoup解析HTML
-    soup = BeautifulSoup(content, 'html.parser')
-    
+    # 使用BeautifulSoup解析HTML（lxml解析器基于C实现，大文件下明显更快）
+    # SoupStrainer只构建目标内容区域的节点，跳过head/script/侧边栏等无关DOM
+    strainer = SoupStrainer('div', class_='type_content_des')
+    soup = BeautifulSoup(content, 'lxml', parse_only=strainer)
+
     # 提取主要内容区域
     main_content = soup.find('div', class_='type_content_des')
     if not main_content:
@@ -58,102 +80,120 @@ def parse_questions_html(file_path: str) -> Dict[str, List[Dict[str, Any]]]:
     current_section = None
     current_question = None
     question_counter = 0
-    
-    for p in paragraphs:
-        text = clean_text(p.get_text())
-        if not text:
-            continue
-            
-        # 检测题型分类
-        if '一、判断题' in text:
-            current_section = 'judgment'
-            continue
-        elif '二、单选题' in text:
-            current_section = 'single_choice'
-            continue
-        elif '三、多选题' in text:
-            current_section = 'multiple_choice'
-            continue
-            
-        if current_section is None:
-            continue
-            
-        # 解析题目
-        if current_section == 'judgment':
-            # 判断题格式：数字. 题目内容
-            judgment_match = re.match(r'^(\d+)\.(.+)', text)
-            if judgment_match:
-                question_text = judgment_match.group(2).strip()
-                # 检查题目中是否包含答案
-                clean_question, embedded_answer = extract_answer_from_text(question_text)
-                
+
+    # 热循环内的名字绑定为局部变量，避免每段落重复的全局/属性查找
+    _clean = clean_text
+    _extract = extract_answer_from_text
+    _num_match = _NUM_DOT_RE.match
+    _opt_match = _ABCD_RE.match
+    judgment_list = questions['judgment']
+    section_lists = {
+        'judgment': judgment_list,
+        'single_choice': questions['single_choice'],
+        'multiple_choice': questions['multiple_choice'],
+    }
+
+    def handle_judgment(text: str):
+        nonlocal current_question, question_counter
+        # 判断题格式：数字. 题目内容
+        judgment_match = _num_match(text)
+        if judgment_match:
+            question_text = judgment_match.group(2).strip()
+            # 检查题目中是否包含答案
+            clean_question, embedded_answer = _extract(question_text)
+
+            question_counter += 1
+            current_question = {
+                'id': question_counter,
+                'type': 'judgment',
+                'question': clean_question,
+                'answer': embedded_answer
+            }
+            judgment_list.append(current_question)
+        # 答案格式：答案: 对/错
+        elif (text.startswith('答案:') or text.startswith('答案：')) and current_question and current_question['type'] == 'judgment':
+            if current_question['answer'] is None:  # 只有当答案还没有设置时才设置
+                answer_text = text.split(':', 1)[-1].split('：', 1)[-1].strip()
+                current_question['answer'] = '对' if '对' in answer_text else '错'
+
+    def handle_choice(text: str):
+        nonlocal current_question, question_counter
+        # 单选题/多选题格式：数字. 题目内容
+        choice_match = _num_match(text)
+        if choice_match:
+            question_text = choice_match.group(2).strip()
+
+            # 检查题目中是否包含答案
+            clean_question, embedded_answer = _extract(question_text)
+
+            # 检查题目末尾是否包含A选项（A.选项内容格式）
+            a_option_match = _A_OPT_RE.search(clean_question)
+            if a_option_match:
+                # 分离题目和A选项
+                pure_question = a_option_match.group(1).strip()
+                a_option_content = a_option_match.group(2).strip()
+
                 question_counter += 1
                 current_question = {
                     'id': question_counter,
-                    'type': 'judgment',
+                    'type': current_section,
+                    'question': pure_question,
+                    'options': {'A': a_option_content},
+                    'answer': embedded_answer
+                }
+            else:
+                question_counter += 1
+                current_question = {
+                    'id': question_counter,
+                    'type': current_section,
                     'question': clean_question,
+                    'options': {},
                     'answer': embedded_answer
                 }
-                questions['judgment'].append(current_question)
-            # 答案格式：答案: 对/错
-            elif (text.startswith('答案:') or text.startswith('答案：')) and current_question and current_question['type'] == 'judgment':
-                if current_question['answer'] is None:  # 只有当答案还没有设置时才设置
-                    answer_text = text.split(':', 1)[-1].split('：', 1)[-1].strip()
-                    current_question['answer'] = '对' if '对' in answer_text else '错'
-                    
-        elif current_section in ['single_choice', 'multiple_choice']:
-            # 单选题/多选题格式：数字. 题目内容
-            choice_match = re.match(r'^(\d+)\.(.+)', text)
-            if choice_match:
-                question_text = choice_match.group(2).strip()
-                
-                # 检查题目中是否包含答案
-                clean_question, embedded_answer = extract_answer_from_text(question_text)
-                
-                # 检查题目末尾是否包含A选项（A.选项内容格式）
-                a_option_match = re.search(r'(.+?)\s*A\.(.+)$', clean_question)
-                if a_option_match:
-                    # 分离题目和A选项
-                    pure_question = a_option_match.group(1).strip()
-                    a_option_content = a_option_match.group(2).strip()
-                    
-                    question_counter += 1
-                    current_question = {
-                        'id': question_counter,
-                        'type': current_section,
-                        'question': pure_question,
-                        'options': {'A': a_option_content},
-                        'answer': embedded_answer
-                    }
-                else:
-                    question_counter += 1
-                    current_question = {
-                        'id': question_counter,
-                        'type': current_section,
-                        'question': clean_question,
-                        'options': {},
-                        'answer': embedded_answer
-                    }
-                
-                questions[current_section].append(current_question)
-                
-            # 选项格式：A. 选项内容（但跳过已经在题目中解析过的A选项）
-            elif re.match(r'^[A-D]\.', text) and current_question and current_question['type'] in ['single_choice', 'multiple_choice']:
-                option_letter = text[0]
-                option_content = text[2:].strip()
-                
-                # 如果是A选项且已经在题目解析时添加过，则跳过
-                if option_letter == 'A' and 'A' in current_question['options']:
-                    continue
-                    
-                current_question['options'][option_letter] = option_content
-                
-            # 答案格式：答案: A
-            elif (text.startswith('答案:') or text.startswith('答案：')) and current_question and current_question['type'] in ['single_choice', 'multiple_choice']:
-                if current_question['answer'] is None:  # 只有当答案还没有设置时才设置
-                    answer_text = text.split(':', 1)[-1].split('：', 1)[-1].strip()
-                    current_question['answer'] = answer_text
-    
+
+            section_lists[current_section].append(current_question)
+
+        # 选项格式：A. 选项内容（但跳过已经在题目中解析过的A选项）
+        elif _opt_match(text) and current_question and current_question['type'] in ['single_choice', 'multiple_choice']:
+            option_letter = text[0]
+            option_content = text[2:].strip()
+
+            # 如果是A选项且已经在题目解析时添加过，则跳过
+            if option_letter == 'A' and 'A' in current_question['options']:
+                return
+
+            current_question['options'][option_letter] = option_content
+
+        # 答案格式：答案: A
+        elif (text.startswith('答案:') or text.startswith('答案：')) and current_question and current_question['type'] in ['single_choice', 'multiple_choice']:
+            if current_question['answer'] is None:  # 只有当答案还没有设置时才设置
+                answer_text = text.split(':', 1)[-1].split('：', 1)[-1].strip()
+                current_question['answer'] = answer_text
+
+    handlers = {
+        'judgment': handle_judgment,
+        'single_choice': handle_choice,
+        'multiple_choice': handle_choice,
+    }
+
+    for p in paragraphs:
+        text = _clean(p.get_text())
+        if not text:
+            continue
+
+        # 检测题型分类（标题段落以"一、/二、/三、"开头，先做前缀判断）
+        if text[:2] in _SECTION_PREFIXES:
+            section = next((s for marker, s in _SECTION_MARKERS.items() if marker in text), None)
+            if section is not None:
+                current_section = section
+                continue
+
+        if current_section is None:
+            continue
+
+        # 解析题目
+        handlers[current_section](text)
+
     # 清理无效题目（没有答案的题目）
     for question_type in questions:
         questions[question_type] = [q for q in questions[question_type] if q['answer'] is not None]
@@ -168,8 +208,12 @@ def save_questions_to_json(questions: Dict[str, List[Dict[str, Any]]], output_fi
         questions: 题目数据
         output_file: 输出文件路径
     """
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(questions, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(questions, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(questions, f, ensure_ascii=False, indent=2)
 
 def print_statistics(questions: Dict[str, List[Dict[str, Any]]]):
     """
@@ -3,19 +3,19 @@ import csv
 import json
 import subprocess
 import sys
-from typing import List, Dict, Any
+from typing import Iterator, List, Dict, Any
 
+import ijson
 
-def run_wrangler_query(command: List[str]) -> Dict[str, Any]:
-    proc = subprocess.run(command, capture_output=True, text=True)
-    out = proc.stdout
-    # Find the JSON array boundaries in stdout
-    start = out.find('[')
-    end = out.rfind(']')
-    if start == -1 or end == -1 or end <= start:
-        raise RuntimeError('Unexpected wrangler output: cannot locate JSON array')
-    json_text = out[start:end+1]
-    return json.loads(json_text)[0]
+
+def iter_wrangler_rows(command: List[str]) -> Iterator[Dict[str, Any]]:
+    # Stream result rows straight off the subprocess pipe instead of buffering
+    # the whole JSON payload; requires --json so stdout is pure JSON
+    proc = subprocess.Popen(command, stdout=subprocess.PIPE)
+    yield from ijson.items(proc.stdout, 'item.results.item')
+    proc.stdout.close()
+    if proc.wait() != 0:
+        raise RuntimeError(f'wrangler exited with status {proc.returncode}')
 
 
 def main():
@@ -34,25 +34,33 @@ def main():
     cmd = [
         'npx', '-y', 'wrangler', 'd1', 'execute', 'exam-database',
         '--command=' + sql,
-        '--config=wrangler.jsonc'
+        '--config=wrangler.jsonc',
+        '--json'
     ]
 
-    result = run_wrangler_query(cmd)
-    rows: List[Dict[str, Any]] = result.get('results', [])
-
-    # Write CSV
+    # Write CSV; positional writer avoids the per-row dict rebuilds of DictWriter
     fieldnames = ['id', 'type', 'question', 'options', 'answer', 'category_big', 'category_small']
+
+    def to_row(r: Dict[str, Any]) -> tuple:
+        # ensure options serialized
+        opts = r.get('options')
+        if isinstance(opts, dict):
+            opts = json.dumps(opts, ensure_ascii=False)
+        return (
+            r.get('id', ''), r.get('type', ''), r.get('question', ''),
+            opts or '', r.get('answer', ''),
+            r.get('category_big', ''), r.get('category_small', ''),
+        )
+
+    row_count = 0
     with open(output_csv, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for r in rows:
-            # ensure options serialized
-            opts = r.get('options')
-            if isinstance(opts, dict):
-                r['options'] = json.dumps(opts, ensure_ascii=False)
-            writer.writerow({k: r.get(k, '') for k in fieldnames})
-
-    print(f'Exported {len(rows)} rows to {output_csv}')
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        for r in iter_wrangler_rows(cmd):
+            writer.writerow(to_row(r))
+            row_count += 1
+
+    print(f'Exported {row_count} rows to {output_csv}')
 
 
 if __name__ == '__main__':
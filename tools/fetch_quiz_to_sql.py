@@ -1,17 +1,54 @@
 #!/usr/bin/env python3
 import json
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Any, List
 
-import urllib.request
+import urllib3
+
+# orjson serializes ~5-10x faster than stdlib json; fall back when missing
+try:
+	import orjson
+
+	def dumps_compact(obj: Any) -> str:
+		return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+	def dumps_compact(obj: Any) -> str:
+		return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+_ABCD_SET = frozenset('ABCD')
+
+MAX_WORKERS = 8
+# Minimum spacing between request starts, aggregate across all worker threads
+REQUEST_INTERVAL = 0.2
+
+# Shared connection pool: one keep-alive pool to the API host instead of a
+# fresh TCP+TLS handshake per request
+_http = urllib3.PoolManager(num_pools=1, maxsize=MAX_WORKERS)
+
+_rate_lock = threading.Lock()
+_next_request_at = 0.0
+
+
+def throttle() -> None:
+	# Keep the politeness guarantee of the old per-request sleep, but as an
+	# aggregate rate limit so threads don't stack their delays
+	global _next_request_at
+	with _rate_lock:
+		now = time.monotonic()
+		wait = _next_request_at - now
+		_next_request_at = max(now, _next_request_at) + REQUEST_INTERVAL
+	if wait > 0:
+		time.sleep(wait)
 
 
 def http_get_json(url: str) -> Dict[str, Any]:
-	with urllib.request.urlopen(url) as resp:
-		data = resp.read()
-		text = data.decode('utf-8', errors='replace')
-		return json.loads(text)
+	resp = _http.request('GET', url, headers={'Accept': 'application/json'})
+	if resp.status != 200:
+		raise RuntimeError(f'HTTP {resp.status} for {url}')
+	return json.loads(resp.data.decode('utf-8', errors='replace'))
 
 
 def normalize_question(q: Dict[str, Any]) -> Dict[str, Any]:
@@ -28,7 +65,7 @@ def normalize_question(q: Dict[str, Any]) -> Dict[str, Any]:
 
 	# Detect multiple choice if answer looks like multiple letters combined, e.g., 'AB' or 'ACD'
 	q_type = 'single_choice'
-	if len(answer) > 1 and all(ch in 'ABCD' for ch in answer):
+	if len(answer) > 1 and set(answer).issubset(_ABCD_SET):
 		q_type = 'multiple_choice'
 
 	return {
@@ -43,19 +80,37 @@ def sql_escape(value: str) -> str:
 	return value.replace("'", "''")
 
 
-def to_insert_sql(item: Dict[str, Any], category_big: str, category_small: str) -> str:
+INSERT_PREFIX = "INSERT INTO questions (type, question, options, answer, category_big, category_small) VALUES "
+# Rows per multi-VALUES INSERT; batching amortizes statement parse/plan cost on D1
+INSERT_BATCH_SIZE = 200
+
+CATEGORY_BIG = '科技'
+CATEGORY_SMALL = '人工智能'
+# The categories never change, so escape them once instead of per row
+_CAT_BIG_SQL = sql_escape(CATEGORY_BIG)
+_CAT_SMALL_SQL = sql_escape(CATEGORY_SMALL)
+
+
+def to_values_row(item: Dict[str, Any]) -> str:
 	question = sql_escape(item['question'])
 	answer = sql_escape(item['answer'])
 	if item['options'] is None:
 		options_sql = 'NULL'
 	else:
-		options_sql = "'" + sql_escape(json.dumps(item['options'], ensure_ascii=False)) + "'"
+		# Compact separators: no point paying for ', ' padding in stored JSON
+		options_sql = "'" + sql_escape(dumps_compact(item['options'])) + "'"
 	return (
-		"INSERT INTO questions (type, question, options, answer, category_big, category_small) "
-		f"VALUES ('{item['type']}', '{question}', {options_sql}, '{answer}', '{sql_escape(category_big)}', '{sql_escape(category_small)}');"
+		f"('{item['type']}', '{question}', {options_sql}, '{answer}', '{_CAT_BIG_SQL}', '{_CAT_SMALL_SQL}')"
 	)
 
 
+def batch_insert_statements(rows: List[str], batch_size: int = INSERT_BATCH_SIZE) -> List[str]:
+	return [
+		INSERT_PREFIX + ',\n'.join(rows[i:i + batch_size]) + ';'
+		for i in range(0, len(rows), batch_size)
+	]
+
+
 def main():
 	if len(sys.argv) < 4:
 		print('Usage: fetch_quiz_to_sql.py <start_id> <end_id> <output_sql_path>')
@@ -66,29 +121,42 @@ def main():
 	output = sys.argv[3]
 
 	api_tpl = 'https://zglg.work/api/quiz/{id}'
-	all_inserts: List[str] = []
-
-	for quiz_id in range(start_id, end_id + 1):
-		url = api_tpl.format(id=quiz_id)
-		try:
-			payload = http_get_json(url)
-			quiz_title = str(payload.get('title', ''))
-			questions = payload.get('questionsWithChosen', [])
-			for q in questions:
-				norm = normalize_question(q)
-				insert_sql = to_insert_sql(norm, '科技', '人工智能')
-				all_inserts.append(insert_sql)
-			# be gentle
-			time.sleep(0.2)
-		except Exception as e:
-			all_inserts.append(f"-- quiz {quiz_id} fetch failed: {e}")
+
+	def fetch_quiz(quiz_id: int) -> List[str]:
+		throttle()
+		payload = http_get_json(api_tpl.format(id=quiz_id))
+		questions = payload.get('questionsWithChosen', [])
+		return [to_values_row(normalize_question(q)) for q in questions]
+
+	# Fetches are latency-bound and independent; collect into dicts keyed by
+	# quiz id so the output stays ordered regardless of completion order
+	rows_by_id: Dict[int, List[str]] = {}
+	failure_by_id: Dict[int, str] = {}
+	with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+		future_to_id = {
+			executor.submit(fetch_quiz, quiz_id): quiz_id
+			for quiz_id in range(start_id, end_id + 1)
+		}
+		for future in as_completed(future_to_id):
+			quiz_id = future_to_id[future]
+			try:
+				rows_by_id[quiz_id] = future.result()
+			except Exception as e:
+				failure_by_id[quiz_id] = f"-- quiz {quiz_id} fetch failed: {e}"
+
+	values_rows: List[str] = []
+	for quiz_id in sorted(rows_by_id):
+		values_rows.extend(rows_by_id[quiz_id])
+	failures = [failure_by_id[quiz_id] for quiz_id in sorted(failure_by_id)]
+
+	all_inserts = batch_insert_statements(values_rows) + failures
 
 	with open(output, 'w', encoding='utf-8') as f:
+		# Single write of the joined buffer beats per-line write + concat
 		f.write('-- Generated from zglg.work API\n')
-		for line in all_inserts:
-			f.write(line + '\n')
+		f.write('\n'.join(all_inserts) + '\n')
 
-	print(f'Wrote {len(all_inserts)} SQL statements to {output}')
+	print(f'Wrote {len(all_inserts)} SQL statements ({len(values_rows)} rows) to {output}')
 
 
 if __name__ == '__main__':
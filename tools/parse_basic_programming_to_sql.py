@@ -14,7 +14,7 @@ Usage:
   venv/bin/python3 tools/parse_basic_programming_to_sql.py exam-app/data exam-app/db/insert-questions-tech-basic-programming.sql
 
 Recommended before running:
-  - Install dependencies: beautifulsoup4, lxml (optional but faster/robust)
+  - Install dependencies: beautifulsoup4, lxml (required; ~10x faster than html.parser)
     venv/bin/python3 -m pip install beautifulsoup4 lxml
 
 After generation, import to D1 (dev example):
@@ -26,34 +26,67 @@ import re
 import sys
 import json
 import copy
+import itertools
+from multiprocessing import Pool
 from typing import Dict, Any, List, Optional
 
+import soupsieve as sv
 from bs4 import BeautifulSoup, Tag
 
+# orjson serializes ~5-10x faster than stdlib json; fall back when missing
+try:
+    import orjson
+
+    def dumps_compact(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    def dumps_compact(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
 
 CATEGORY_BIG = "科技"
 CATEGORY_SMALL = "基础编程"
 
+INSERT_PREFIX = "INSERT INTO questions (type, question, options, answer, category_big, category_small) VALUES "
+# Rows per multi-VALUES INSERT; batching amortizes statement parse/plan cost on D1
+INSERT_BATCH_SIZE = 200
+
 
 def sql_escape(value: str) -> str:
     return value.replace("'", "''")
 
 
-def to_insert_sql(item: Dict[str, Any]) -> str:
+# The categories never change, so escape them once instead of per row
+_CAT_BIG_SQL = sql_escape(CATEGORY_BIG)
+_CAT_SMALL_SQL = sql_escape(CATEGORY_SMALL)
+
+
+def to_values_row(item: Dict[str, Any]) -> str:
     question_html = sql_escape(item['question'])
     answer = sql_escape(item['answer'])
     if item['options'] is None:
         options_sql = 'NULL'
     else:
-        options_sql = "'" + sql_escape(json.dumps(item['options'], ensure_ascii=False)) + "'"
+        # Compact separators: no point paying for ', ' padding in stored JSON
+        options_sql = "'" + sql_escape(dumps_compact(item['options'])) + "'"
     return (
-        "INSERT INTO questions (type, question, options, answer, category_big, category_small) "
-        f"VALUES ('{item['type']}', '{question_html}', {options_sql}, '{answer}', '{sql_escape(CATEGORY_BIG)}', '{sql_escape(CATEGORY_SMALL)}');"
+        f"('{item['type']}', '{question_html}', {options_sql}, '{answer}', '{_CAT_BIG_SQL}', '{_CAT_SMALL_SQL}')"
     )
 
 
+def batch_insert_statements(rows: List[str], batch_size: int = INSERT_BATCH_SIZE) -> List[str]:
+    return [
+        INSERT_PREFIX + ',\n'.join(rows[i:i + batch_size]) + ';'
+        for i in range(0, len(rows), batch_size)
+    ]
+
+
+_IMG_RE = re.compile(r'<img', re.IGNORECASE)
+
+
 def has_img_html(html: str) -> bool:
-    return '<img' in html.lower()
+    # Compiled case-insensitive search avoids allocating a lowercase copy
+    return _IMG_RE.search(html) is not None
 
 
 SAFE_TAGS = {
@@ -62,12 +95,45 @@ SAFE_TAGS = {
     'ul', 'ol', 'li', 'table', 'thead', 'tbody', 'tr', 'th', 'td'
 }
 
+EXCLUDE_CLASS_SUBSTRINGS = [
+    'question-select',
+    'answer-wrap',
+    'comment-wrap',
+    'quick-publish',
+    'result-wrap',
+    'question-desc-header',
+    'rightAction',
+]
+
+# CSS selectors compiled once at import; soupsieve re-parses the selector
+# string on every plain .select()/.select_one() call otherwise
+_SEL_QUESTION_ITEM = sv.compile('div.question-item')
+_SEL_SYNTAX_BLOCK = sv.compile('div.syntaxhighlighter')
+_SEL_TOOLBAR = sv.compile('.toolbar')
+_SEL_TYPE_LABEL = sv.compile('.singleClass, .commonClass, .multipleClass, .judgmentClass')
+_SEL_OPTIONS = sv.compile("div[class*='question-select']")
+_SEL_OPTION_ITEM = sv.compile('div.option-item')
+_SEL_OPTION_LABEL = sv.compile('.label')
+_SEL_OPTION_CONTENT = sv.compile('.content')
+_SEL_ANSWER_WRAP = sv.compile("div[class*='answer-wrap']")
+_SEL_GREEN_ANSWER = sv.compile('span.tw-text-green-500')
+_SEL_STEM_HOST = sv.compile('.commonPaperHtml')
+_SEL_QUESTION_DESC = sv.compile('.question-desc')
+_SEL_EXCLUDED = sv.compile(', '.join(f"div[class*='{cls}']" for cls in EXCLUDE_CLASS_SUBSTRINGS))
+
+# Whitespace-normalization patterns used by sanitize_html_fragment, compiled once
+_CRLF_RE = re.compile(r'\r\n')
+_MULTI_BLANK_RE = re.compile(r'\n\s*\n\s*\n+')
+_CTRL_WS_RE = re.compile(r'[\t\x0b\x0c\r]+')
+_MULTI_SPACE_RE = re.compile(r' +')
+_NL_SPACE_RE = re.compile(r' *\n *')
+
 
 def flatten_code_blocks(soup: BeautifulSoup) -> None:
     # Convert Nowcoder syntaxhighlighter blocks into <pre><code>text</code></pre>
-    for block in list(soup.select('div.syntaxhighlighter')):
+    for block in list(_SEL_SYNTAX_BLOCK.select(soup)):
         # Remove toolbar (often contains "复制代码")
-        for tb in block.select('.toolbar'):
+        for tb in _SEL_TOOLBAR.select(block):
             tb.decompose()
         text = block.get_text('\n', strip=False)
         # drop lingering "复制代码" markers just in case
@@ -79,14 +145,16 @@ def flatten_code_blocks(soup: BeautifulSoup) -> None:
         block.replace_with(pre)
 
 
+def _normalize_plain_text(text: str) -> str:
+    # Same whitespace rules sanitize_html_fragment applies to a single-line
+    # fragment, minus the BeautifulSoup round-trip
+    return _MULTI_SPACE_RE.sub(' ', _CTRL_WS_RE.sub(' ', text.replace('复制代码', ''))).strip()
+
+
 def sanitize_html_fragment(html: str) -> str:
     if not html:
         return ''
-    # Use lxml if available for better parsing
-    try:
-        frag = BeautifulSoup(html, 'lxml')
-    except Exception:
-        frag = BeautifulSoup(html, 'html.parser')
+    frag = BeautifulSoup(html, 'lxml')
 
     flatten_code_blocks(frag)
 
@@ -99,24 +167,31 @@ def sanitize_html_fragment(html: str) -> str:
         p.insert_after('\n')
         p.unwrap()
 
-    # Remove all attributes and non-safe tags while preserving their text/children
-    for el in list(frag.find_all(True)):
-        # Strip attributes
-        el.attrs = {}
+    # Remove all attributes and non-safe tags while preserving their text/children.
+    # Single walk over descendants: strip attributes in place, collect tags to
+    # unwrap, then unwrap deepest-first so children aren't reparented repeatedly.
+    to_unwrap = []
+    for el in frag.descendants:
+        if not isinstance(el, Tag):
+            continue
+        if el.attrs:
+            el.attrs = {}
         if el.name not in SAFE_TAGS:
-            el.unwrap()
+            to_unwrap.append(el)
+    for el in reversed(to_unwrap):
+        el.unwrap()
 
     # Collapse excessive whitespace
     out = str(frag)
     # Remove any remaining '复制代码'
     out = out.replace('复制代码', '')
     # Normalize whitespace while preserving newlines
-    out = re.sub(r'\r\n', '\n', out)
-    out = re.sub(r'\n\s*\n\s*\n+', '\n\n', out)
-    out = re.sub(r'[\t\x0b\x0c\r]+', ' ', out)
-    out = re.sub(r' +', ' ', out)
+    out = _CRLF_RE.sub('\n', out)
+    out = _MULTI_BLANK_RE.sub('\n\n', out)
+    out = _CTRL_WS_RE.sub(' ', out)
+    out = _MULTI_SPACE_RE.sub(' ', out)
     # Trim spaces around newlines
-    out = re.sub(r' *\n *', '\n', out)
+    out = _NL_SPACE_RE.sub('\n', out)
     return out.strip()
 
 
@@ -142,57 +217,62 @@ def extract_answer_text(answer_wrap: Tag) -> Optional[str]:
     if m:
         return m.group(1).strip()
     # Sometimes letter may be inside a span
-    green = answer_wrap.select_one('span.tw-text-green-500')
+    green = _SEL_GREEN_ANSWER.select_one(answer_wrap)
     if green and green.get_text(strip=True):
         return green.get_text(strip=True)
     return None
 
 
-EXCLUDE_CLASS_SUBSTRINGS = [
-    'question-select',
-    'answer-wrap',
-    'comment-wrap',
-    'quick-publish',
-    'result-wrap',
-    'question-desc-header',
-    'rightAction',
-]
+_MARKER_TEXTS = ('官方解析', '知识点', '题友讨论')
 
 
 def remove_unwanted_blocks(root: Tag) -> None:
     # Remove blocks by class substrings
-    for cls in EXCLUDE_CLASS_SUBSTRINGS:
-        for el in root.select(f"div[class*='{cls}']"):
-            el.decompose()
-    # Remove obvious analysis/knowledge sections
-    for el in list(root.find_all(['div', 'section', 'p', 'span'])):
+    for el in _SEL_EXCLUDED.select(root):
+        el.decompose()
+    # Remove obvious analysis/knowledge sections; the per-element get_text scan
+    # is O(n^2), so bail out early when none of the markers appear at all
+    if not any(marker in str(root) for marker in _MARKER_TEXTS):
+        return
+    # Collect first, then decompose, so removals can't invalidate the walk
+    to_remove = []
+    for el in root.find_all(['div', 'section', 'p', 'span']):
         txt = el.get_text(" ", strip=True)
-        if not txt:
-            continue
-        if txt.startswith('官方解析') or txt.startswith('知识点') or txt.startswith('题友讨论'):
+        if txt.startswith(_MARKER_TEXTS):
             # Decompose the parent block to ensure full removal
-            (el.parent or el).decompose()
+            to_remove.append(el.parent or el)
+    for el in to_remove:
+        if not el.decomposed:
+            el.decompose()
 
 
 def extract_stem_html(q_item: Tag) -> Optional[str]:
-    # Work on a clone to avoid mutating the original tree
-    q_clone = BeautifulSoup(str(q_item), 'lxml') if q_item and q_item.name else None
-    if q_clone is None:
+    # Work on a clone to avoid mutating the original tree; copying the Tag
+    # directly skips the serialize + reparse round-trip per question
+    if q_item is None or not q_item.name:
         return None
+    q_clone = copy.copy(q_item)
     remove_unwanted_blocks(q_clone)
     # Prefer the Nowcoder stem container
     stem_host = (
-        q_clone.select_one('.commonPaperHtml')
-        or q_clone.select_one('.question-desc')
+        _SEL_STEM_HOST.select_one(q_clone)
+        or _SEL_QUESTION_DESC.select_one(q_clone)
         or q_clone
     )
     raw_html = stem_host.decode_contents().strip()
+    # Check the raw HTML for images: <img> tags don't survive sanitization,
+    # so the skip rule must run first (and it spares sanitizing discards)
+    if has_img_html(raw_html):
+        return None
+    # Plain-text fragments don't need the parse + serialize round-trip
+    if '<' not in raw_html and '\n' not in raw_html:
+        return _normalize_plain_text(raw_html)
     return sanitize_html_fragment(raw_html)
 
 
 def parse_question_item(q_item: Tag) -> Optional[Dict[str, Any]]:
     # Determine type
-    type_label_el = q_item.select_one('.singleClass, .commonClass, .multipleClass, .judgmentClass')
+    type_label_el = _SEL_TYPE_LABEL.select_one(q_item)
     q_type = None
     if type_label_el is not None:
         q_type = normalize_question_type(type_label_el.get_text(strip=True))
@@ -200,24 +280,32 @@ def parse_question_item(q_item: Tag) -> Optional[Dict[str, Any]]:
         return None
 
     # Options (if any)
-    options_div = q_item.select_one("div[class*='question-select']")
+    options_div = _SEL_OPTIONS.select_one(q_item)
     options: Optional[Dict[str, str]] = None
     if options_div is not None:
         options = {}
-        for opt in options_div.select("div.option-item"):
-            label_el = opt.select_one('.label')
-            content_el = opt.select_one('.content')
+        for opt in _SEL_OPTION_ITEM.select(options_div):
+            label_el = _SEL_OPTION_LABEL.select_one(opt)
+            content_el = _SEL_OPTION_CONTENT.select_one(opt)
             if not label_el or not content_el:
                 continue
             label = label_el.get_text(strip=True).upper()
-            # Preserve sanitized HTML content
-            content_html = sanitize_html_fragment(content_el.decode_contents().strip())
+            # Preserve sanitized HTML content; most options are plain text,
+            # which doesn't need the parse + serialize round-trip
+            raw = content_el.decode_contents().strip()
+            # Same raw-HTML image check as the stem: skip before sanitizing
+            if has_img_html(raw):
+                return None
+            if '<' not in raw and '\n' not in raw:
+                content_html = _normalize_plain_text(raw)
+            else:
+                content_html = sanitize_html_fragment(raw)
             options[label] = content_html
         if not options:
             options = None
 
     # Answer
-    answer_wrap = q_item.select_one("div[class*='answer-wrap']")
+    answer_wrap = _SEL_ANSWER_WRAP.select_one(q_item)
     answer_text = extract_answer_text(answer_wrap)
     if answer_text is None:
         return None
@@ -236,14 +324,6 @@ def parse_question_item(q_item: Tag) -> Optional[Dict[str, Any]]:
     if stem_html is None:
         return None
 
-    # Skip if any image present in stem or options
-    if has_img_html(stem_html):
-        return None
-    if options is not None:
-        for v in options.values():
-            if has_img_html(v):
-                return None
-
     # For single_choice/multiple_choice, ensure options exist
     if q_type in ('single_choice', 'multiple_choice') and not options:
         return None
@@ -263,15 +343,10 @@ def parse_question_item(q_item: Tag) -> Optional[Dict[str, Any]]:
 def parse_file(path: str) -> List[Dict[str, Any]]:
     with open(path, 'r', encoding='utf-8', errors='replace') as f:
         html = f.read()
-    # Prefer lxml if available
-    parser = 'lxml'
-    try:
-        soup = BeautifulSoup(html, parser)
-    except Exception:
-        soup = BeautifulSoup(html, 'html.parser')
+    soup = BeautifulSoup(html, 'lxml')
 
     results: List[Dict[str, Any]] = []
-    for q_item in soup.select('div.question-item'):
+    for q_item in _SEL_QUESTION_ITEM.select(soup):
         try:
             parsed = parse_question_item(q_item)
             if parsed is not None:
@@ -290,26 +365,28 @@ def main():
     input_dir = sys.argv[1]
     output_sql = sys.argv[2]
 
-    all_questions: List[Dict[str, Any]] = []
-    for name in sorted(os.listdir(input_dir)):
-        if not name.lower().endswith('.html'):
-            continue
-        path = os.path.join(input_dir, name)
-        file_questions = parse_file(path)
-        all_questions.extend(file_questions)
+    paths = [
+        os.path.join(input_dir, name)
+        for name in sorted(os.listdir(input_dir))
+        if name.lower().endswith('.html')
+    ]
+    # Files are independent and parsing is CPU-bound, so fan out across cores;
+    # Pool.map preserves input order
+    with Pool() as pool:
+        per_file = pool.map(parse_file, paths, chunksize=4)
+    all_questions: List[Dict[str, Any]] = list(itertools.chain.from_iterable(per_file))
 
     inserts: List[str] = [
         "-- Generated by tools/parse_basic_programming_to_sql.py",
         f"-- Category: {CATEGORY_BIG}/{CATEGORY_SMALL}",
         f"-- Source: {input_dir}",
     ]
-    for q in all_questions:
-        inserts.append(to_insert_sql(q))
+    inserts.extend(batch_insert_statements([to_values_row(q) for q in all_questions]))
 
     os.makedirs(os.path.dirname(output_sql), exist_ok=True)
     with open(output_sql, 'w', encoding='utf-8') as f:
-        for line in inserts:
-            f.write(line + '\n')
+        # Single write of the joined buffer beats per-line write + concat
+        f.write('\n'.join(inserts) + '\n')
 
     # Print brief stats and few samples
     type_counts: Dict[str, int] = {}
@@ -323,8 +400,8 @@ def main():
         print(f"Answer: {q['answer']}")
         if q['options']:
             print("Options:", ", ".join(sorted(q['options'].keys())))
-        print("Stem (truncated):", re.sub(r'\s+', ' ', q['question'])[:120] + ('...' if len(q['question']) > 120 else ''))
-    print(f"\nWrote {len(inserts)-3} SQL statements to {output_sql}")
+        print("Stem (truncated):", ' '.join(q['question'].split())[:120] + ('...' if len(q['question']) > 120 else ''))
+    print(f"\nWrote {len(inserts)-3} INSERT statements ({len(all_questions)} rows) to {output_sql}")
 
 
 if __name__ == '__main__':